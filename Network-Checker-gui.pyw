@@ -449,6 +449,7 @@ class NetworkCheckerGUI:
             self.logger.error(f"GUI error: {e}", exc_info=True)
             raise
         finally:
+            self.network_checker.close()
             self.logger.info("GUI closed")
 
 
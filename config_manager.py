@@ -3,63 +3,131 @@ Configuration management for the Network Checker application.
 """
 import json
 import os
+from functools import cached_property
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Dict, Optional
 
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; fall back to the standard library json module
+    orjson = None
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
 
 class ConfigManager:
     """Manages application configuration with defaults and validation."""
     
-    DEFAULT_CONFIG = {
-        "network": {
+    # Read-only (lists stored as tuples) so instances can't mutate the shared
+    # defaults; use _copy_defaults() for a mutable copy
+    DEFAULT_CONFIG = MappingProxyType({
+        "network": MappingProxyType({
             "ping_count": 1,
             "timeout": 5,
-            "dns_servers": ["google.com", "8.8.8.8"]
-        },
-        "logging": {
+            "dns_servers": ("google.com", "8.8.8.8"),
+            "dns_cache_ttl": 0,
+            "ip_cache_ttl": 0
+        }),
+        "logging": MappingProxyType({
             "level": "INFO",
             "file": "network_checker.log",
             "max_bytes": 1048576,
             "backup_count": 3
-        }
+        })
+    })
+    
+    # Attribute name -> (section, key); attributes are refreshed by load_config and set
+    SETTINGS = {
+        "ping_count": ("network", "ping_count"),
+        "timeout": ("network", "timeout"),
+        "dns_servers": ("network", "dns_servers"),
+        "dns_cache_ttl": ("network", "dns_cache_ttl"),
+        "ip_cache_ttl": ("network", "ip_cache_ttl"),
+        "log_level": ("logging", "level"),
+        "log_file": ("logging", "file"),
+        "log_max_bytes": ("logging", "max_bytes"),
+        "log_backup_count": ("logging", "backup_count"),
     }
     
     def __init__(self, config_file: str = "config.json"):
         """
         Initialize configuration manager.
         
+        The configuration file is not read until the first setting is accessed.
+        
         Args:
             config_file: Path to configuration file
         """
         self.config_file = Path(config_file)
-        self.config: Dict[str, Any] = {}
+    
+    @cached_property
+    def config(self) -> Dict[str, Any]:
+        """Configuration dictionary, loaded from file on first access."""
+        # load_config assigns self.config, which replaces this property
         self.load_config()
+        return self.config
+    
+    def __getattr__(self, name: str) -> Any:
+        """Populate the flat setting attributes when one is read before the first load."""
+        if name in ConfigManager.SETTINGS:
+            if "config" in self.__dict__:
+                self._update_settings()
+            else:
+                self.load_config()
+            return self.__dict__[name]
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
     
     def load_config(self) -> None:
         """Load configuration from file or create with defaults."""
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    self.config = json.load(f)
-                # Merge with defaults to ensure all keys exist
-                self.config = self._merge_with_defaults(self.config)
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Warning: Could not load config file: {e}")
-                print("Using default configuration")
-                self.config = self.DEFAULT_CONFIG.copy()
-        else:
+        try:
+            # Open directly instead of checking exists() first: one syscall, no race
+            self.config = _json_loads(self.config_file.read_bytes())
+            # Merge with defaults to ensure all keys exist
+            self.config = self._merge_with_defaults(self.config)
+        except FileNotFoundError:
             # Create default config file
-            self.config = self.DEFAULT_CONFIG.copy()
+            self.config = self._copy_defaults()
             self.save_config()
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"Warning: Could not load config file: {e}")
+            print("Using default configuration")
+            self.config = self._copy_defaults()
+        self._update_settings()
     
     def save_config(self) -> None:
         """Save current configuration to file."""
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2)
+            self.config_file.write_bytes(_json_dumps(self.config))
         except IOError as e:
             print(f"Warning: Could not save config file: {e}")
     
+    @classmethod
+    def _copy_defaults(cls) -> Dict[str, Any]:
+        """Return a mutable copy of DEFAULT_CONFIG."""
+        return {
+            section: {key: cls._thaw(value) for key, value in values.items()}
+            for section, values in cls.DEFAULT_CONFIG.items()
+        }
+    
+    @staticmethod
+    def _thaw(value: Any) -> Any:
+        """Return a mutable copy of a frozen default value (tuples become lists)."""
+        return list(value) if isinstance(value, tuple) else value
+    
     def _merge_with_defaults(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """
         Merge loaded config with defaults to ensure all keys exist.
@@ -70,7 +138,7 @@ class ConfigManager:
         Returns:
             Merged configuration
         """
-        merged = self.DEFAULT_CONFIG.copy()
+        merged = self._copy_defaults()
         for section, values in config.items():
             if section in merged and isinstance(values, dict):
                 merged[section].update(values)
@@ -104,37 +172,19 @@ class ConfigManager:
         """
         return self.config.get(section, {})
     
-    @property
-    def ping_count(self) -> int:
-        """Get ping count setting."""
-        return self.get("network", "ping_count", 1)
-    
-    @property
-    def timeout(self) -> int:
-        """Get timeout setting."""
-        return self.get("network", "timeout", 5)
-    
-    @property
-    def dns_servers(self) -> list:
-        """Get DNS servers list."""
-        return self.get("network", "dns_servers", ["google.com"])
-    
-    @property
-    def log_level(self) -> str:
-        """Get logging level."""
-        return self.get("logging", "level", "INFO")
-    
-    @property
-    def log_file(self) -> str:
-        """Get log file path."""
-        return self.get("logging", "file", "network_checker.log")
-    
-    @property
-    def log_max_bytes(self) -> int:
-        """Get log file max bytes."""
-        return self.get("logging", "max_bytes", 1048576)
+    def set(self, section: str, key: str, value: Any) -> None:
+        """
+        Set configuration value and refresh the matching setting attribute.
+        
+        Args:
+            section: Configuration section
+            key: Configuration key
+            value: New value
+        """
+        self.config.setdefault(section, {})[key] = value
+        self._update_settings()
     
-    @property
-    def log_backup_count(self) -> int:
-        """Get log backup count."""
-        return self.get("logging", "backup_count", 3)
+    def _update_settings(self) -> None:
+        """Copy settings from the configuration dictionary onto plain attributes."""
+        for name, (section, key) in self.SETTINGS.items():
+            setattr(self, name, self.get(section, key, self._thaw(self.DEFAULT_CONFIG[section][key])))
@@ -2,18 +2,85 @@
 Network operations module with secure subprocess calls and comprehensive error handling.
 """
 import os
-import platform
-import subprocess
+import sys
+import asyncio
+import concurrent.futures
+import ctypes
+import ipaddress
+import re
 import socket
+import struct
+import time
 import psutil
 import logging
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, List, Callable, Sequence
 from config_manager import ConfigManager
 
+# sys.platform is fixed at interpreter start, unlike platform.system() which queries uname
+_IS_WINDOWS = sys.platform == 'win32'
+
+# Invariant part of the ping command; the count is read from the config per call
+_PING_PREFIX = ('ping', '-n' if _IS_WINDOWS else '-c')
+
+# Default gateway in one line of `ip route` / `ipconfig` output
+_GATEWAY_RE_LINUX = re.compile(rb'^default via (\S+)')
+_GATEWAY_RE_WINDOWS = re.compile(rb'Default Gateway[. ]*:\s*(\S+)')
+
+try:
+    from pyroute2 import IPRoute
+except ImportError:
+    # pyroute2 is optional; without it the gateway is parsed from `ip route`
+    IPRoute = None
+
+try:
+    import icmplib
+except ImportError:
+    # icmplib is optional; without it pings run the system ping command
+    icmplib = None
+
+try:
+    import dns.asyncresolver
+    import dns.exception
+except ImportError:
+    # dnspython is optional; without it lookups go through the system resolver
+    dns = None
+
+# Exceptions meaning a DNS lookup timed out or got a definitive failure answer
+if dns is not None:
+    _DNS_TIMEOUT_ERRORS = (asyncio.TimeoutError, dns.exception.Timeout)
+    _DNS_FAILURE_ERRORS = (socket.gaierror, dns.exception.DNSException)
+else:
+    _DNS_TIMEOUT_ERRORS = (asyncio.TimeoutError,)
+    _DNS_FAILURE_ERRORS = (socket.gaierror,)
+
+
+def _is_ip_address(host: str) -> bool:
+    """Return True if host is an IP address literal rather than a name."""
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return True
+
+
+class _MibIpForwardRow(ctypes.Structure):
+    """MIB_IPFORWARDROW as returned by the Windows GetIpForwardTable API."""
+    _fields_ = [(name, ctypes.c_uint32) for name in (
+        'dwForwardDest', 'dwForwardMask', 'dwForwardPolicy', 'dwForwardNextHop',
+        'dwForwardIfIndex', 'dwForwardType', 'dwForwardProto', 'dwForwardAge',
+        'dwForwardNextHopAS', 'dwForwardMetric1', 'dwForwardMetric2',
+        'dwForwardMetric3', 'dwForwardMetric4', 'dwForwardMetric5'
+    )]
+
 
 class NetworkChecker:
     """Handles all network diagnostic operations with proper error handling and logging."""
     
+    # Seconds a failed DNS lookup is remembered; short so transient failures don't stick
+    DNS_NEGATIVE_CACHE_TTL = 5
+    # Cached DNS entries kept per cache before it is purged
+    DNS_CACHE_MAX_ENTRIES = 256
+    
     def __init__(self, config: ConfigManager, logger: logging.Logger):
         """
         Initialize NetworkChecker.
@@ -24,7 +91,28 @@ class NetworkChecker:
         """
         self.config = config
         self.logger = logger
-        self.is_windows = platform.system().lower() == 'windows'
+        self._icmp_permitted = True
+        self._ip_cache: Optional[Tuple[float, str, str]] = None
+        # hostname -> (expiry time, result)
+        self._dns_cache: Dict[str, Tuple[float, str]] = {}
+        self._dns_negative_cache: Dict[str, Tuple[float, str]] = {}
+        # Kept for the lifetime of the checker so repeated runs reuse its threads
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(8, len(self.config.dns_servers) + 3),
+            thread_name_prefix='netchk'
+        )
+    
+    def close(self) -> None:
+        """Shut down the worker thread pool."""
+        self._executor.shutdown(wait=False)
+    
+    def __enter__(self) -> 'NetworkChecker':
+        """Enter a context that closes the checker on exit."""
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the checker when leaving the context."""
+        self.close()
     
     def get_default_gateway(self) -> Optional[str]:
         """
@@ -33,73 +121,213 @@ class NetworkChecker:
         Returns:
             Gateway IP address or None if not found
         """
+        return asyncio.run(self._gateway_async())
+    
+    async def _run_command(self, command: Sequence[str]) -> Tuple[int, str]:
+        """
+        Run a command without blocking the event loop.
+        
+        The process is killed if it does not finish within the configured timeout.
+        
+        Args:
+            command: Command and arguments (never passed through a shell)
+            
+        Returns:
+            Tuple of (return code, decoded stdout)
+            
+        Raises:
+            asyncio.TimeoutError: If the command exceeds the timeout
+        """
+        proc = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
         try:
-            if self.is_windows:
-                # SECURITY FIX: Use list-based command instead of shell=True
-                result = subprocess.run(
-                    ['ipconfig'],
-                    capture_output=True,
-                    text=True,
-                    timeout=self.config.timeout,
-                    check=False
-                )
-                output = result.stdout
-                
-                for line in output.splitlines():
-                    if 'Default Gateway' in line:
-                        parts = line.split()
-                        if len(parts) >= 4:
-                            gateway = parts[-1]
-                            self.logger.info(f"Found default gateway: {gateway}")
-                            return gateway
-            else:
-                # SECURITY FIX: Use list-based command instead of shell=True
-                result = subprocess.run(
-                    ['ip', 'route'],
-                    capture_output=True,
-                    text=True,
-                    timeout=self.config.timeout,
-                    check=False
-                )
-                output = result.stdout
+            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=self.config.timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise
+        return proc.returncode, stdout.decode(errors='replace')
+    
+    def _gateway_from_route_table(self) -> Optional[str]:
+        """
+        Read the default gateway straight from the OS routing table.
+        
+        Uses a netlink RTM_GETROUTE query on Linux (requires pyroute2) and
+        GetIpForwardTable on Windows, avoiding a process spawn and text parsing.
+        
+        Returns:
+            Gateway IP address or None if unavailable
+        """
+        try:
+            if _IS_WINDOWS:
+                iphlpapi = ctypes.windll.iphlpapi
+                size = ctypes.c_ulong(0)
+                # First call only reports the buffer size needed
+                iphlpapi.GetIpForwardTable(None, ctypes.byref(size), False)
+                buffer = ctypes.create_string_buffer(size.value)
+                if iphlpapi.GetIpForwardTable(buffer, ctypes.byref(size), False) != 0:
+                    return None
                 
-                for line in output.splitlines():
-                    if line.startswith('default via'):
-                        parts = line.split()
-                        if len(parts) >= 3:
-                            gateway = parts[2]
-                            self.logger.info(f"Found default gateway: {gateway}")
-                            return gateway
+                count = ctypes.c_uint32.from_buffer(buffer).value
+                rows = (_MibIpForwardRow * count).from_buffer(buffer, ctypes.sizeof(ctypes.c_uint32))
+                defaults = [
+                    row for row in rows
+                    if row.dwForwardDest == 0 and row.dwForwardMask == 0 and row.dwForwardNextHop
+                ]
+                if not defaults:
+                    return None
+                best = min(defaults, key=lambda row: row.dwForwardMetric1)
+                # Addresses are stored in network byte order
+                return socket.inet_ntoa(struct.pack('<I', best.dwForwardNextHop))
+            
+            if IPRoute is None:
+                return None
+            
+            with IPRoute() as ipr:
+                routes = ipr.get_default_routes(family=socket.AF_INET)
+            for route in routes:
+                gateway = route.get_attr('RTA_GATEWAY')
+                if gateway:
+                    return gateway
+            return None
+            
+        except Exception as e:
+            self.logger.debug("Routing table lookup failed, falling back to command output: %s", e)
+            return None
+    
+    async def _gateway_async(self) -> Optional[str]:
+        """
+        Get the default gateway IP address without blocking the event loop.
+        
+        The routing table is queried directly when possible; otherwise the
+        output of ipconfig / ip route is parsed.
+        
+        Returns:
+            Gateway IP address or None if not found
+        """
+        # Run off the event loop: pyroute2's synchronous API drives its own loop
+        loop = asyncio.get_running_loop()
+        gateway = await loop.run_in_executor(self._executor, self._gateway_from_route_table)
+        if gateway:
+            self.logger.info("Found default gateway: %s", gateway)
+            return gateway
+        
+        try:
+            # SECURITY FIX: Use list-based command instead of shell=True
+            command = ['ipconfig'] if _IS_WINDOWS else ['ip', 'route']
+            gateway = await self._first_matching_line(command, self._parse_gateway_line)
+            
+            if gateway:
+                self.logger.info("Found default gateway: %s", gateway)
+                return gateway
             
             self.logger.warning("Default gateway not found")
             return None
             
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             self.logger.error("Timeout while getting default gateway")
             return None
         except Exception as e:
-            self.logger.error(f"Error getting default gateway: {e}", exc_info=True)
+            self.logger.error("Error getting default gateway: %s", e, exc_info=True)
             return None
     
+    def _parse_gateway_line(self, line: bytes) -> Optional[str]:
+        """
+        Extract the default gateway from one line of ipconfig / ip route output.
+        
+        Lines are matched as raw bytes; only the gateway itself is decoded.
+        
+        Args:
+            line: Undecoded output line
+            
+        Returns:
+            Gateway IP address or None if the line does not contain one
+        """
+        pattern = _GATEWAY_RE_WINDOWS if _IS_WINDOWS else _GATEWAY_RE_LINUX
+        match = pattern.search(line)
+        return match.group(1).decode('ascii', errors='replace') if match else None
+    
+    async def _first_matching_line(self, command: Sequence[str], parse_line: Callable[[bytes], Optional[str]]) -> Optional[str]:
+        """
+        Stream a command's output and stop at the first line that parses.
+        
+        The process is killed as soon as a match is found, so the rest of its
+        output is never read or buffered.
+        
+        Args:
+            command: Command and arguments (never passed through a shell)
+            parse_line: Returns a value for a matching (undecoded) line, None otherwise
+            
+        Returns:
+            First parsed value or None if no line matched
+            
+        Raises:
+            asyncio.TimeoutError: If no match is found within the timeout
+        """
+        proc = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        
+        async def scan() -> Optional[str]:
+            async for line in proc.stdout:
+                value = parse_line(line)
+                if value:
+                    return value
+            return None
+        
+        try:
+            return await asyncio.wait_for(scan(), timeout=self.config.timeout)
+        finally:
+            if proc.returncode is None:
+                try:
+                    proc.kill()
+                except ProcessLookupError:
+                    pass
+            await proc.wait()
+    
     def get_ip_and_interface(self) -> Tuple[str, str]:
         """
         Get the local IP address and network interface name.
         
+        Caching is opt-in: with a non-zero ip_cache_ttl, a successful lookup
+        is reused for that many seconds.
+        
         Returns:
             Tuple of (IP address, interface name)
         """
+        now = time.monotonic()
+        ttl = self.config.ip_cache_ttl
+        if ttl > 0 and self._ip_cache and now - self._ip_cache[0] < ttl:
+            return self._ip_cache[1], self._ip_cache[2]
+        
         try:
-            for interface, addrs in psutil.net_if_addrs().items():
-                for addr in addrs:
-                    if addr.family == socket.AF_INET and not addr.address.startswith("127."):
-                        self.logger.info(f"Found IP {addr.address} on interface {interface}")
-                        return addr.address, interface
+            # Stop at the first non-loopback IPv4 address instead of walking every interface
+            ip_address, interface = next(
+                (
+                    (addr.address, interface)
+                    for interface, addrs in psutil.net_if_addrs().items()
+                    for addr in addrs
+                    if addr.family == socket.AF_INET and not addr.address.startswith("127.")
+                ),
+                ('N/A', 'N/A')
+            )
             
-            self.logger.warning("No non-loopback IP address found")
-            return 'N/A', 'N/A'
+            if ip_address == 'N/A':
+                self.logger.warning("No non-loopback IP address found")
+                return 'N/A', 'N/A'
+            
+            self.logger.info("Found IP %s on interface %s", ip_address, interface)
+            if ttl > 0:
+                self._ip_cache = (now, ip_address, interface)
+            return ip_address, interface
             
         except Exception as e:
-            self.logger.error(f"Error getting IP and interface: {e}", exc_info=True)
+            self.logger.error("Error getting IP and interface: %s", e, exc_info=True)
             return 'N/A', 'N/A'
     
     def get_logon_server(self) -> str:
@@ -109,14 +337,14 @@ class NetworkChecker:
         Returns:
             Logon server name or 'N/A'
         """
-        if self.is_windows:
+        if _IS_WINDOWS:
             try:
                 # SECURITY FIX: Use environment variable directly instead of shell command
                 logon_server = os.environ.get('LOGONSERVER', 'N/A')
-                self.logger.info(f"Logon server: {logon_server}")
+                self.logger.info("Logon server: %s", logon_server)
                 return logon_server
             except Exception as e:
-                self.logger.error(f"Error getting logon server: {e}", exc_info=True)
+                self.logger.error("Error getting logon server: %s", e, exc_info=True)
                 return 'N/A'
         else:
             return 'N/A'
@@ -131,31 +359,116 @@ class NetworkChecker:
         Returns:
             Ping output or error message
         """
-        try:
-            param = '-n' if self.is_windows else '-c'
-            # SECURITY FIX: Use list-based command instead of shell=True
-            command = ['ping', param, str(self.config.ping_count), host]
+        return asyncio.run(self._ping_async(host))
+    
+    async def _ping_async(self, host: str) -> str:
+        """
+        Ping a host without blocking the event loop.
+        
+        Echo requests are sent from an in-process ICMP socket when icmplib is
+        installed and the OS allows it; otherwise the ping command is run.
+        
+        Args:
+            host: Hostname or IP address to ping
             
-            self.logger.debug(f"Executing ping command: {' '.join(command)}")
+        Returns:
+            Ping output or error message
+        """
+        if icmplib is not None and self._icmp_permitted:
+            try:
+                return await self._icmp_ping_async(host)
+            except icmplib.SocketPermissionError as e:
+                # e.g. Linux without net.ipv4.ping_group_range covering this user;
+                # don't retry the socket on every ping
+                self._icmp_permitted = False
+                self.logger.debug("ICMP socket unavailable, falling back to ping command: %s", e)
+        return await self._ping_command_async(host)
+    
+    async def _icmp_ping_async(self, host: str) -> str:
+        """
+        Ping a host over an unprivileged ICMP socket using icmplib.
+        
+        Args:
+            host: Hostname or IP address to ping
+            
+        Returns:
+            Ping summary or error message
             
-            result = subprocess.run(
-                command,
-                capture_output=True,
-                text=True,
+        Raises:
+            icmplib.SocketPermissionError: If ICMP sockets are not permitted
+        """
+        try:
+            result = await icmplib.async_ping(
+                host,
+                count=self.config.ping_count,
                 timeout=self.config.timeout,
-                check=False
+                privileged=False
             )
+        except icmplib.SocketPermissionError:
+            raise
+        except Exception as e:
+            error_msg = f'Ping error: {str(e)}'
+            self.logger.error("Ping to %s: %s", host, error_msg)
+            return error_msg
+        
+        if result.is_alive:
+            self.logger.info("Ping to %s successful", host)
+            # Same "Reply from" wording as the Windows ping command, which the GUI keys on
+            return (
+                f'Reply from {result.address}: '
+                f'received={result.packets_received}/{result.packets_sent} '
+                f'avg={result.avg_rtt:.1f}ms loss={result.packet_loss:.0%}'
+            )
+        
+        self.logger.warning("Ping to %s failed: no reply to %s requests", host, result.packets_sent)
+        return f'Ping failed (no reply to {result.packets_sent} requests)'
+    
+    async def ping_many(self, hosts: List[str]) -> Dict[str, str]:
+        """
+        Ping several hosts concurrently.
+        
+        The echo requests for all hosts are in flight at once on the event
+        loop, so the total time is close to the slowest round trip rather
+        than the sum.
+        
+        Args:
+            hosts: Hostnames or IP addresses to ping
+            
+        Returns:
+            Dictionary mapping each host to its ping output or error message
+        """
+        replies = await asyncio.gather(*[self._ping_async(host) for host in hosts])
+        return dict(zip(hosts, replies))
+    
+    async def _ping_command_async(self, host: str) -> str:
+        """
+        Ping a host by running the system ping command.
+        
+        Args:
+            host: Hostname or IP address to ping
+            
+        Returns:
+            Ping output or error message
+        """
+        try:
+            # SECURITY FIX: Use list-based command instead of shell=True
+            command = (*_PING_PREFIX, str(self.config.ping_count), host)
+            
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Executing ping command: %s", ' '.join(command))
             
-            if result.returncode == 0:
-                self.logger.info(f"Ping to {host} successful")
-                return result.stdout
+            returncode, output = await self._run_command(command)
+            
+            if returncode == 0:
+                self.logger.info("Ping to %s successful", host)
+                return output
             else:
-                self.logger.warning(f"Ping to {host} failed with return code {result.returncode}")
-                return f'Ping failed (return code: {result.returncode})'
+                self.logger.warning("Ping to %s failed with return code %s", host, returncode)
+                return f'Ping failed (return code: {returncode})'
                 
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             error_msg = f'Ping timeout after {self.config.timeout} seconds'
-            self.logger.error(f"Ping to {host}: {error_msg}")
+            self.logger.error("Ping to %s: %s", host, error_msg)
             return error_msg
         except FileNotFoundError:
             error_msg = 'Ping command not found'
@@ -163,7 +476,7 @@ class NetworkChecker:
             return error_msg
         except Exception as e:
             error_msg = f'Ping error: {str(e)}'
-            self.logger.error(f"Ping to {host}: {error_msg}", exc_info=True)
+            self.logger.error("Ping to %s: %s", host, error_msg, exc_info=True)
             return error_msg
     
     def dns_query(self, hostname: str) -> str:
@@ -176,36 +489,173 @@ class NetworkChecker:
         Returns:
             Resolved IP address or error message
         """
-        try:
-            # Set socket timeout
-            socket.setdefaulttimeout(self.config.timeout)
+        return asyncio.run(self.dns_query_async(hostname))
+    
+    async def dns_query_async(self, hostname: str) -> str:
+        """
+        Perform DNS resolution for a hostname without blocking the event loop.
+        
+        Names are queried with dnspython's async resolver when it is installed,
+        so a timed-out query is actually abandoned instead of leaving a
+        getaddrinfo call running in a worker thread. Either way the timeout
+        is applied per call rather than by changing the process-wide default
+        socket timeout. Caching is opt-in: with a non-zero dns_cache_ttl,
+        answers are cached for that many seconds and resolution failures for
+        at most DNS_NEGATIVE_CACHE_TTL seconds.
+        
+        Args:
+            hostname: Hostname to resolve
             
-            self.logger.debug(f"Resolving DNS for {hostname}")
-            ip_address = socket.gethostbyname(hostname)
+        Returns:
+            Resolved IP address or error message
+        """
+        return await self._resolve_dns(hostname, self._create_resolver())
+    
+    async def _resolve_dns(self, hostname: str, resolver: Optional[Any]) -> str:
+        """
+        Resolve a hostname with the given dnspython resolver, or getaddrinfo.
+        
+        Args:
+            hostname: Hostname to resolve
+            resolver: Resolver from _create_resolver, or None to use getaddrinfo
+            
+        Returns:
+            Resolved IP address or error message
+        """
+        cached = self._get_cached_dns(hostname)
+        if cached is not None:
+            self.logger.debug("DNS cache hit for %s: %s", hostname, cached)
+            return cached
+        
+        loop = asyncio.get_running_loop()
+        try:
+            self.logger.debug("Resolving DNS for %s", hostname)
+            if resolver is not None and not _is_ip_address(hostname):
+                # search=True applies the system search domains like getaddrinfo does,
+                # so short intranet names still resolve
+                answer = await resolver.resolve(
+                    hostname, 'A', lifetime=self.config.timeout, search=True
+                )
+                ip_address = answer[0].address
+            else:
+                # Use the persistent pool rather than the loop's default executor,
+                # which asyncio.run would wait on if a lookup outlives the timeout
+                infos = await asyncio.wait_for(
+                    loop.run_in_executor(self._executor, socket.getaddrinfo, hostname, None, socket.AF_INET),
+                    self.config.timeout
+                )
+                ip_address = infos[0][4][0]
             
-            self.logger.info(f"DNS resolution for {hostname}: {ip_address}")
+            self.logger.info("DNS resolution for %s: %s", hostname, ip_address)
+            self._dns_negative_cache.pop(hostname, None)
+            self._cache_dns(self._dns_cache, hostname, ip_address, self.config.dns_cache_ttl)
             return ip_address
             
-        except socket.timeout:
+        except _DNS_TIMEOUT_ERRORS:
             error_msg = f'DNS timeout after {self.config.timeout} seconds'
-            self.logger.error(f"DNS query for {hostname}: {error_msg}")
+            self.logger.error("DNS query for %s: %s", hostname, error_msg)
             return error_msg
-        except socket.gaierror as e:
+        except _DNS_FAILURE_ERRORS as e:
             error_msg = f'DNS resolution failed: {e}'
-            self.logger.error(f"DNS query for {hostname}: {error_msg}")
+            self.logger.error("DNS query for %s: %s", hostname, error_msg)
+            self._cache_dns(
+                self._dns_negative_cache, hostname, error_msg,
+                min(self.DNS_NEGATIVE_CACHE_TTL, self.config.dns_cache_ttl)
+            )
             return error_msg
         except Exception as e:
             error_msg = f'DNS error: {str(e)}'
-            self.logger.error(f"DNS query for {hostname}: {error_msg}", exc_info=True)
+            self.logger.error("DNS query for %s: %s", hostname, error_msg, exc_info=True)
             return error_msg
-        finally:
-            # Reset socket timeout
-            socket.setdefaulttimeout(None)
+    
+    def _create_resolver(self) -> Optional[Any]:
+        """
+        Create a dnspython async resolver from the system DNS configuration.
+        
+        Called for every lookup batch rather than once per checker, so a new
+        network, VPN or DHCP lease is picked up by the next check.
+        
+        Returns:
+            Resolver instance, or None if dnspython is unavailable or unconfigured
+        """
+        if dns is None:
+            return None
+        try:
+            return dns.asyncresolver.Resolver()
+        except dns.exception.DNSException as e:
+            self.logger.warning("Could not configure DNS resolver, using system resolver: %s", e)
+            return None
+    
+    def _get_cached_dns(self, hostname: str) -> Optional[str]:
+        """
+        Look up an unexpired DNS result.
+        
+        Args:
+            hostname: Hostname to look up
+            
+        Returns:
+            Cached IP address or error message, or None if not cached
+        """
+        now = time.monotonic()
+        for cache in (self._dns_cache, self._dns_negative_cache):
+            entry = cache.get(hostname)
+            if entry and entry[0] > now:
+                return entry[1]
+        return None
+    
+    def _cache_dns(self, cache: Dict[str, Tuple[float, str]], hostname: str, result: str, ttl: float) -> None:
+        """
+        Store a DNS result, purging expired entries once the cache is full.
+        
+        Args:
+            cache: Positive or negative DNS cache
+            hostname: Resolved hostname
+            result: IP address or error message
+            ttl: Seconds to keep the entry; 0 disables caching
+        """
+        if ttl <= 0:
+            return
+        now = time.monotonic()
+        if len(cache) >= self.DNS_CACHE_MAX_ENTRIES:
+            for expired in [h for h, (expires, _) in cache.items() if expires <= now]:
+                del cache[expired]
+            if len(cache) >= self.DNS_CACHE_MAX_ENTRIES:
+                cache.clear()
+        cache[hostname] = (now + ttl, result)
+    
+    async def _dns_query_all(self, hostnames: List[str]) -> Dict[str, str]:
+        """
+        Resolve several hostnames concurrently.
+        
+        The lookups share one resolver built from the current system DNS
+        configuration.
+        
+        Args:
+            hostnames: Hostnames to resolve
+            
+        Returns:
+            Dictionary mapping each hostname to its DNS result
+        """
+        resolver = self._create_resolver()
+        results = await asyncio.gather(*[self._resolve_dns(h, resolver) for h in hostnames])
+        return dict(zip(hostnames, results))
     
     def run_all_checks(self) -> Dict[str, Any]:
         """
         Run all network diagnostic checks.
         
+        Returns:
+            Dictionary containing all check results
+        """
+        return asyncio.run(self._run_all_checks_async())
+    
+    async def _run_all_checks_async(self) -> Dict[str, Any]:
+        """
+        Run all network diagnostic checks concurrently on the event loop.
+        
+        Subprocesses and DNS lookups are awaited together so their wait times
+        overlap; the remaining blocking calls run on the checker's thread pool.
+        
         Returns:
             Dictionary containing all check results
         """
@@ -221,30 +671,37 @@ class NetworkChecker:
             'dns_results': {}
         }
         
-        # Get IP and interface
-        ip_address, interface = self.get_ip_and_interface()
-        results['ip'] = ip_address
-        results['interface'] = interface
+        loop = asyncio.get_running_loop()
+        ip_task = loop.run_in_executor(self._executor, self.get_ip_and_interface)
+        logon_task = loop.run_in_executor(self._executor, self.get_logon_server)
         
-        # Get logon server
-        results['logon_server'] = self.get_logon_server()
+        # Ping Internet (8.8.8.8 - Google DNS) and resolve DNS without
+        # waiting for gateway discovery
+        self.logger.info("Testing Internet connectivity with ping to 8.8.8.8")
+        internet_task = asyncio.create_task(self._ping_async('8.8.8.8'))
+        dns_task = asyncio.create_task(self._dns_query_all(self.config.dns_servers))
         
         # Get and ping gateway
-        gateway = self.get_default_gateway()
+        gateway = await self._gateway_async()
         results['gateway'] = gateway
         
         if gateway:
-            results['gateway_ping'] = self.ping(gateway)
+            results['gateway_ping'] = await self._ping_async(gateway)
         else:
             results['gateway_ping'] = 'Gateway not found'
         
-        # Ping Internet (8.8.8.8 - Google DNS)
-        self.logger.info("Testing Internet connectivity with ping to 8.8.8.8")
-        results['internet_ping'] = self.ping('8.8.8.8')
+        # Get IP and interface
+        ip_address, interface = await ip_task
+        results['ip'] = ip_address
+        results['interface'] = interface
+        
+        # Get logon server
+        results['logon_server'] = await logon_task
+        
+        results['internet_ping'] = await internet_task
         
         # DNS queries
-        for dns_server in self.config.dns_servers:
-            results['dns_results'][dns_server] = self.dns_query(dns_server)
+        results['dns_results'] = await dns_task
         
         self.logger.info("Network diagnostics completed")
         return results